@@ -0,0 +1,20 @@
+# Gunicorn configuration for THINK-AI.
+#
+# The workload is I/O-bound: almost all request time is spent waiting on
+# Gemini, so default sync workers (one blocked request per process) waste
+# memory on mostly-idle processes. Threaded workers let a couple of
+# processes multiplex many concurrent LLM calls.
+import os
+
+bind = "0.0.0.0:" + os.environ.get("PORT", "5000")
+worker_class = "gthread"
+workers = 2
+threads = 32
+# Must stay off: server.py pre-warms a gRPC channel when imported, and gRPC
+# channels that have carried an RPC do not survive fork(). With preloading
+# the master would warm the channel and every forked worker would inherit
+# dead channel state, hanging on its first Gemini call. Without preloading
+# each worker imports server.py after fork and warms its own channel.
+preload_app = False
+# Gemini calls can take ~10 s; keep the worker timeout comfortably above that.
+timeout = 60
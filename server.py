@@ -1,218 +1,516 @@
-# server.py
-
-# --- Import necessary libraries ---
-from flask import Flask, request, jsonify, send_from_directory
-from werkzeug.utils import secure_filename
-from dotenv import load_dotenv
-import os
-import json
-import re
-import PyPDF2
-import google.generativeai as genai
-
-# --- Load Environment Variables ---
-# Make sure you have a .env file with your GOOGLE_API_KEY
-load_dotenv()
-
-# --- Configuration & AI Model Initialization ---
-API_KEY = os.getenv('GOOGLE_API_KEY')
-model = None
-
-def initialize_gemini():
-    """Initializes the Gemini model. Returns True on success, False on failure."""
-    global model
-    if not API_KEY:
-        print("FATAL ERROR: GOOGLE_API_KEY environment variable is not set.")
-        return False
-    try:
-        print("Configuring Gemini API...")
-        genai.configure(api_key=API_KEY)
-        print("Initializing Gemini model...")
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        print("Gemini model initialized successfully.")
-        return True
-    except Exception as e:
-        print("======================================================================")
-        print("FATAL ERROR: Could not initialize the Gemini model.")
-        print(f"Specific Error Details: {e}")
-        print("======================================================================")
-        return False
-
-# --- Flask App Initial Setup ---
-app = Flask(__name__, static_folder='.', static_url_path='')
-UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'pdf'}
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-
-def allowed_file(filename):
-    """A helper function to check if an uploaded file has the allowed .pdf extension."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
-
-# --- AI-Powered Logic Functions ---
-
-def parse_resume(file_path):
-    """Extracts the full raw text from an uploaded PDF file."""
-    try:
-        with open(file_path, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            text = "".join(page.extract_text() for page in reader.pages if page.extract_text())
-        if not text.strip():
-            raise ValueError("PDF parsing resulted in empty text. The PDF might be an image or corrupted.")
-        return {"text": text}
-    except Exception as e:
-        print(f"Error parsing PDF file at {file_path}: {e}")
-        raise Exception(f"Failed to read PDF content: {e}")
-
-def generate_questions(resume_data):
-    """Generates the initial set of interview questions."""
-    if not model: raise Exception("Cannot generate questions: Gemini model not initialized.")
-    if not resume_data or not resume_data.get("text"): raise ValueError("No resume text provided.")
-
-    prompt = f"""
-    Analyze the following resume and generate exactly 5 insightful, open-ended interview questions
-    that would be effective for screening this candidate. The questions should be diverse and cover
-    technical skills, past projects, and behavioral aspects mentioned in the resume.
-
-    Return the result as a valid JSON array of strings. Example: ["Question 1", "Question 2"]
-
-    Resume Text:
-    ---
-    {resume_data['text']}
-    ---
-    """
-    try:
-        response = model.generate_content(prompt)
-        match = re.search(r"```json\s*([\s\S]*?)\s*```", response.text)
-        if not match:
-             # Fallback if the model doesn't use markdown
-             clean_text = response.text.strip()
-             if clean_text.startswith('[') and clean_text.endswith(']'):
-                 questions = json.loads(clean_text)
-                 return questions
-             else:
-                raise ValueError("No valid JSON array found in the AI response.")
-        json_text = match.group(1).strip()
-        questions = json.loads(json_text)
-        return questions
-    except (json.JSONDecodeError, Exception) as e:
-        print(f"Error processing AI response for questions: {e}\nResponse was:\n{response.text}")
-        raise Exception("The AI model returned an invalid format for questions.")
-
-def generate_follow_up_question(history):
-    """Generates a conversational follow-up question."""
-    if not model: raise Exception("Cannot generate follow-up: Gemini model not initialized.")
-    
-    formatted_history = "\n".join([f"{item['role']}: {item['parts'][0]['text']}" for item in history])
-    prompt = f"""
-    You are an AI interviewer. Based on the conversation history below, ask a relevant and concise follow-up question.
-    Your goal is to dig deeper into the candidate's last answer.
-
-    If the candidate's last answer seems complete and you have no more to ask on that topic,
-    respond with only the exact string "[NEXT_QUESTION]". Do not add any other text.
-
-    History:
-    ---
-    {formatted_history}
-    ---
-    Follow-up Question or command:
-    """
-    try:
-        response = model.generate_content(prompt)
-        return response.text.strip()
-    except Exception as e:
-        print(f"Error generating follow-up from AI: {e}")
-        return "[NEXT_QUESTION]" # Failsafe
-
-def generate_report(answers):
-    """Generates a final performance report."""
-    if not model: raise Exception("Cannot generate report: Gemini model not initialized.")
-    if not answers: return {}
-
-    answers_formatted = "\n".join([f"- {ans}" for ans in answers])
-    prompt = f"""
-    You are an expert career coach and hiring manager. Analyze the following interview answers and provide a
-    constructive performance report. The report should be a valid JSON object with the following keys:
-    "overallScore" (a number out of 10),
-    "strengths" (a paragraph identifying positive aspects like clarity, specific examples, and confidence),
-    "weaknesses" (a paragraph identifying areas for improvement like vagueness, lack of detail, or poor structure),
-    "suggestion" (a paragraph with a single, actionable suggestion for the candidate to improve their interviewing skills).
-
-    Answers provided by the candidate:
-    ---
-    {answers_formatted}
-    ---
-    """
-    try:
-        response = model.generate_content(prompt)
-        match = re.search(r"```json\s*([\s\S]*?)\s*```", response.text)
-        if not match:
-            raise ValueError("No valid JSON object found in the AI response.")
-        json_text = match.group(1).strip()
-        report = json.loads(json_text)
-        return report
-    except (json.JSONDecodeError, Exception) as e:
-        print(f"Error processing AI response for report: {e}\nResponse was:\n{response.text}")
-        raise Exception("The AI model returned an invalid format for the report.")
-
-# --- Web Page Routes ---
-@app.route('/')
-def serve_landing_page():
-    """Serves the main landing page (assuming you have an index.html)."""
-    return send_from_directory('.', 'index.html')
-
-@app.route('/interview.html')
-def serve_interview_page():
-    """Serves the interactive interview application page."""
-    return send_from_directory('.', 'interview.html')
-
-# --- API Endpoints ---
-@app.route('/api/analyze', methods=['POST'])
-def analyze_resume_api():
-    if 'resume' not in request.files: return jsonify({"error": "No resume file part"}), 400
-    file = request.files['resume']
-    if file.filename == '': return jsonify({"error": "No file selected"}), 400
-
-    if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
-        try:
-            resume_data = parse_resume(file_path)
-            questions = generate_questions(resume_data)
-            return jsonify({"questions": questions})
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
-        finally:
-            if os.path.exists(file_path):
-                os.remove(file_path) # Clean up the uploaded file
-    return jsonify({"error": "Invalid file type. Please upload a PDF."}), 400
-
-@app.route('/api/follow-up', methods=['POST'])
-def follow_up_api():
-    data = request.get_json()
-    if not data or 'history' not in data: return jsonify({"error": "Missing history"}), 400
-    try:
-        question = generate_follow_up_question(data['history'])
-        return jsonify({"question": question})
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-@app.route('/api/evaluate', methods=['POST'])
-def evaluate_answers_api():
-    data = request.get_json()
-    if not data or 'answers' not in data: return jsonify({"error": "Missing answers"}), 400
-    try:
-        report = generate_report(data['answers'])
-        return jsonify(report)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-# --- Server Execution ---
-if __name__ == '__main__':
-    if not initialize_gemini():
-        exit(1) # Exit if the AI model fails to initialize
-    
-    # For local development:
-    app.run(host='0.0.0.0', port=5000, debug=True)
-    # For deploying on a platform like Render, your Start Command should be: gunicorn "server:app"
\ No newline at end of file
+# server.py
+
+# --- Import necessary libraries ---
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+import asyncio
+import datetime
+import hashlib
+import os
+import json
+import re
+import uuid
+import fitz  # PyMuPDF
+import google.generativeai as genai
+
+# --- Load Environment Variables ---
+# Make sure you have a .env file with your GOOGLE_API_KEY
+load_dotenv()
+
+# --- Configuration & AI Model Initialization ---
+API_KEY = os.getenv('GOOGLE_API_KEY')
+MODEL_NAME = 'gemini-1.5-flash'
+model = None
+
+# Static instruction block shared by every request. Hoisted out of the
+# per-request prompts so it can be uploaded once via Gemini context caching
+# instead of being re-sent (and re-billed) with every call.
+SYSTEM_INSTRUCTION = """
+You are THINK-AI, an expert AI interviewer, career coach, and hiring manager.
+You screen candidates based on their resumes, conduct conversational interviews,
+and write constructive performance reports.
+Whenever you are asked to return JSON, return only valid JSON with exactly the
+requested keys and no surrounding commentary.
+"""
+
+def initialize_gemini():
+    """Initializes the Gemini model. Returns True on success, False on failure."""
+    global model
+    if not API_KEY:
+        print("FATAL ERROR: GOOGLE_API_KEY environment variable is not set.")
+        return False
+    try:
+        print("Configuring Gemini API...")
+        # Pin the gRPC transport so one long-lived channel is reused across
+        # requests instead of paying TLS setup under load. gRPC channels are
+        # not fork-safe: this must run in the worker process, after any fork
+        # (see gunicorn.conf.py — preload_app stays off).
+        genai.configure(
+            api_key=API_KEY,
+            transport='grpc',
+            client_options={'api_endpoint': 'generativelanguage.googleapis.com'},
+        )
+        print("Initializing Gemini model...")
+        try:
+            # Upload the static instructions once; subsequent requests reference
+            # the cache handle, so they only pay for the dynamic content.
+            cache = genai.caching.CachedContent.create(
+                model=MODEL_NAME,
+                system_instruction=SYSTEM_INSTRUCTION,
+                ttl=datetime.timedelta(hours=1),
+            )
+            model = genai.GenerativeModel.from_cached_content(cache)
+            print("Gemini model initialized with cached system instructions.")
+        except Exception as cache_error:
+            # Context caching enforces a minimum cached-token count and may not
+            # be available for every account/model; fall back to sending the
+            # instructions with each request.
+            print(f"Context caching unavailable ({cache_error}); using uncached model.")
+            model = genai.GenerativeModel(MODEL_NAME, system_instruction=SYSTEM_INSTRUCTION)
+        try:
+            # Pre-warm: a trivial generation forces the TLS handshake and
+            # channel setup now instead of on the first user request.
+            model.generate_content("ping", generation_config={"max_output_tokens": 1})
+            print("Gemini channel pre-warmed.")
+        except Exception as warm_error:
+            print(f"Gemini pre-warm request failed (continuing): {warm_error}")
+        print("Gemini model initialized successfully.")
+        return True
+    except Exception as e:
+        print("======================================================================")
+        print("FATAL ERROR: Could not initialize the Gemini model.")
+        print(f"Specific Error Details: {e}")
+        print("======================================================================")
+        return False
+
+# --- Flask App Initial Setup ---
+app = Flask(__name__, static_folder='.', static_url_path='')
+ALLOWED_EXTENSIONS = {'pdf'}
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in ALLOWED_EXTENSIONS)
+# Reject oversize uploads in Werkzeug (413) before they ever reach the parser;
+# a 50 MB image-heavy PDF can otherwise burn minutes of CPU on one worker.
+app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024
+# And kill runaway parses of PDFs that are under the size cap but still
+# pathologically slow to extract.
+PARSE_TIMEOUT_SECONDS = 10
+
+def allowed_file(filename):
+    """A helper function to check if an uploaded file has the allowed .pdf extension."""
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_response(payload, status=200):
+    """Builds a JSON response with orjson, which serializes in C and emits
+    bytes directly (no intermediate str + encode pass like stdlib json).
+    Falls back to jsonify when orjson is unavailable."""
+    if orjson is None:
+        response = jsonify(payload)
+        response.status_code = status
+        return response
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
+# Response schemas for Gemini's native JSON mode. With these in the
+# generation_config the model returns bare JSON, so no markdown fences to
+# strip and no retry loop for malformed responses.
+ANALYSIS_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "questions": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "rubric": {"type": "STRING"},
+    },
+    "required": ["questions", "rubric"],
+}
+
+REPORT_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "overallScore": {"type": "NUMBER"},
+        "strengths": {"type": "STRING"},
+        "weaknesses": {"type": "STRING"},
+        "suggestion": {"type": "STRING"},
+    },
+    "required": ["overallScore", "strengths", "weaknesses", "suggestion"],
+}
+
+_JSON_BLOCK_RE = re.compile(r"```json\s*([\s\S]*?)\s*```")
+
+def _strip_json_fences(text):
+    """Defensive fallback: JSON mode should never emit markdown fences, but
+    strip them if a model revision does."""
+    match = _JSON_BLOCK_RE.search(text)
+    return match.group(1).strip() if match else text.strip()
+
+# --- Semantic Response Cache ---
+# Near-duplicate resumes and answer sets are common (demo re-runs, template
+# resumes), so cache Gemini responses keyed by a sentence embedding of the
+# input and serve the stored JSON when cosine similarity clears the threshold.
+# If sentence-transformers is not installed the cache is simply disabled and
+# every request goes to Gemini as before.
+try:
+    from sentence_transformers import SentenceTransformer
+    import numpy as np
+    _SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    _SEMANTIC_CACHE_AVAILABLE = False
+
+SIMILARITY_THRESHOLD = 0.95
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+EXACT_CACHE_MAX_ENTRIES = 256
+
+# Exact cache for repeat uploads of the same PDF: blake2b(file bytes) -> analysis.
+# Hashing runs at GB/s, so a hit skips both PDF parsing and the Gemini call
+# for the cost of a dict lookup.
+_exact_analysis_cache = {}
+
+# Evaluation rubrics generated alongside the questions, keyed by the session id
+# returned from /api/analyze. /api/evaluate reuses the stored rubric instead of
+# re-sending the resume to Gemini.
+SESSION_RUBRICS_MAX_ENTRIES = 1024
+_session_rubrics = {}
+
+# Formatted conversation turns per session, so each follow-up call formats
+# only the new turns instead of re-joining the whole history (O(new) per turn
+# rather than O(total), which is quadratic over an interview).
+MAX_HISTORY_TURNS = 10
+SESSION_HISTORY_MAX_ENTRIES = 1024
+_session_histories = {}
+
+def _format_history(history, session_id=None):
+    """Formats the history for the follow-up prompt, incrementally when possible.
+
+    Only the last MAX_HISTORY_TURNS turns are sent to Gemini; the model just
+    needs the recent exchange to craft a follow-up, and input-token cost
+    scales with what we send.
+    """
+    if session_id:
+        turns = _session_histories.get(session_id)
+        if turns is None:
+            if len(_session_histories) >= SESSION_HISTORY_MAX_ENTRIES:
+                _session_histories.pop(next(iter(_session_histories)))
+            turns = []
+            _session_histories[session_id] = turns
+        if len(turns) > len(history):
+            # Client restarted its history; drop the stale tail.
+            del turns[len(history):]
+        for item in history[len(turns):]:
+            turns.append(f"{item['role']}: {item['parts'][0]['text']}")
+    else:
+        turns = [f"{item['role']}: {item['parts'][0]['text']}" for item in history]
+    return "\n".join(turns[-MAX_HISTORY_TURNS:])
+
+_embedder = None
+_analysis_cache = []  # list of (embedding, {"questions": ..., "rubric": ...}) tuples
+_report_cache = []    # list of (embedding, report) tuples
+
+def _embed_text(text):
+    """Embeds text for cache lookup. Returns None when the cache is disabled."""
+    global _embedder
+    if not _SEMANTIC_CACHE_AVAILABLE:
+        return None
+    if _embedder is None:
+        print("Loading embedding model for the semantic cache (first request only)...")
+        _embedder = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+    # normalize_embeddings=True lets us use a plain dot product as cosine similarity.
+    return _embedder.encode(text, normalize_embeddings=True)
+
+def _semantic_cache_get(cache, embedding):
+    """Returns the cached response for the most similar entry, or None on a miss."""
+    if embedding is None or not cache:
+        return None
+    similarities = np.stack([entry[0] for entry in cache]) @ embedding
+    best = int(np.argmax(similarities))
+    if similarities[best] > SIMILARITY_THRESHOLD:
+        return cache[best][1]
+    return None
+
+def _semantic_cache_put(cache, embedding, response):
+    """Stores a response, evicting the oldest entry once the cache is full."""
+    if embedding is None:
+        return
+    if len(cache) >= SEMANTIC_CACHE_MAX_ENTRIES:
+        cache.pop(0)
+    cache.append((embedding, response))
+
+# --- AI-Powered Logic Functions ---
+
+PARSE_MAX_WORKERS = 4
+# Resumes are rarely longer than 2 pages; capping pages and characters bounds
+# both worst-case parse time on oversized uploads and the Gemini input-token
+# cost of the analysis prompt.
+MAX_PAGES = 3
+MAX_CHARS = 20000
+
+def _extract_page_text(file_bytes, page_number):
+    """Extracts one page's text from its own Document handle.
+
+    PyMuPDF documents are not safe to share across threads, but extraction
+    releases the GIL, so each worker opens the in-memory bytes separately
+    (a cheap operation next to the extraction itself).
+    """
+    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+        return doc[page_number].get_text("text")
+
+def parse_resume(file_bytes):
+    """Extracts the full raw text from the uploaded PDF bytes."""
+    try:
+        with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+            # Only the first few pages matter for a resume; ignore the rest.
+            page_count = min(doc.page_count, MAX_PAGES)
+            if page_count <= 1:
+                # Single page: skip the thread-pool overhead.
+                texts = [doc[p].get_text("text") for p in range(page_count)]
+        if page_count > 1:
+            # Extract pages in parallel; wall time approaches single-page latency.
+            with ThreadPoolExecutor(max_workers=min(PARSE_MAX_WORKERS, page_count)) as executor:
+                texts = list(executor.map(
+                    lambda p: _extract_page_text(file_bytes, p), range(page_count)))
+        text = "\n".join(t for t in texts if t)[:MAX_CHARS]
+        if not text.strip():
+            raise ValueError("PDF parsing resulted in empty text. The PDF might be an image or corrupted.")
+        return {"text": text}
+    except Exception as e:
+        print(f"Error parsing uploaded PDF: {e}")
+        raise Exception(f"Failed to read PDF content: {e}")
+
+async def generate_questions_and_rubric(resume_data):
+    """Generates the interview questions and the evaluation rubric in one Gemini call.
+
+    Fusing the two prompts halves the number of round trips for a full
+    interview: /api/evaluate reuses the stored rubric instead of re-sending
+    the resume to Gemini.
+    """
+    if not model: raise Exception("Cannot generate questions: Gemini model not initialized.")
+    if not resume_data or not resume_data.get("text"): raise ValueError("No resume text provided.")
+
+    embedding = _embed_text(resume_data['text'])
+    cached = _semantic_cache_get(_analysis_cache, embedding)
+    if cached is not None:
+        return cached
+
+    prompt = f"""
+    Analyze the following resume and produce two things:
+    1. Exactly 5 insightful, open-ended interview questions that would be effective for
+       screening this candidate. The questions should be diverse and cover technical
+       skills, past projects, and behavioral aspects mentioned in the resume.
+    2. A short evaluation rubric: one paragraph describing what strong answers from
+       this specific candidate should demonstrate, given their background.
+
+    Return the result as a valid JSON object with exactly two keys:
+    "questions" (an array of 5 strings) and "rubric" (a string).
+
+    Resume Text:
+    ---
+    {resume_data['text']}
+    ---
+    """
+    try:
+        response = await model.generate_content_async(
+            prompt,
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": ANALYSIS_RESPONSE_SCHEMA,
+            },
+        )
+        analysis = json.loads(_strip_json_fences(response.text))
+        if not isinstance(analysis.get("questions"), list):
+            raise ValueError("AI response is missing the 'questions' array.")
+        _semantic_cache_put(_analysis_cache, embedding, analysis)
+        return analysis
+    except (json.JSONDecodeError, Exception) as e:
+        print(f"Error processing AI response for questions: {e}\nResponse was:\n{response.text}")
+        raise Exception("The AI model returned an invalid format for questions.")
+
+def generate_follow_up_question(history, session_id=None):
+    """Streams a conversational follow-up question chunk by chunk.
+
+    Returns a generator of text chunks so the client sees the first tokens
+    after first-token latency instead of waiting for the full response.
+    """
+    if not model: raise Exception("Cannot generate follow-up: Gemini model not initialized.")
+
+    formatted_history = _format_history(history, session_id)
+    prompt = f"""
+    Based on the conversation history below, ask a relevant and concise follow-up question.
+    Your goal is to dig deeper into the candidate's last answer.
+
+    If the candidate's last answer seems complete and you have no more to ask on that topic,
+    respond with only the exact string "[NEXT_QUESTION]". Do not add any other text.
+
+    History:
+    ---
+    {formatted_history}
+    ---
+    Follow-up Question or command:
+    """
+    def stream():
+        sent_any = False
+        try:
+            for chunk in model.generate_content(prompt, stream=True):
+                if chunk.text:
+                    sent_any = True
+                    yield chunk.text
+        except Exception as e:
+            print(f"Error generating follow-up from AI: {e}")
+            if not sent_any:
+                yield "[NEXT_QUESTION]" # Failsafe
+    return stream()
+
+async def generate_report(answers, rubric=None):
+    """Generates a final performance report, optionally guided by a stored rubric."""
+    if not model: raise Exception("Cannot generate report: Gemini model not initialized.")
+    if not answers: return {}
+
+    answers_formatted = "\n".join([f"- {ans}" for ans in answers])
+    embedding = _embed_text(answers_formatted)
+    cached = _semantic_cache_get(_report_cache, embedding)
+    if cached is not None:
+        return cached
+    rubric_section = f"\n    Evaluation rubric for this candidate:\n    {rubric}\n" if rubric else ""
+    prompt = f"""
+    Analyze the following interview answers and provide a constructive
+    performance report.{rubric_section}
+    The report should be a valid JSON object with the following keys:
+    "overallScore" (a number out of 10),
+    "strengths" (a paragraph identifying positive aspects like clarity, specific examples, and confidence),
+    "weaknesses" (a paragraph identifying areas for improvement like vagueness, lack of detail, or poor structure),
+    "suggestion" (a paragraph with a single, actionable suggestion for the candidate to improve their interviewing skills).
+
+    Answers provided by the candidate:
+    ---
+    {answers_formatted}
+    ---
+    """
+    try:
+        response = await model.generate_content_async(
+            prompt,
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": REPORT_RESPONSE_SCHEMA,
+            },
+        )
+        report = json.loads(_strip_json_fences(response.text))
+        _semantic_cache_put(_report_cache, embedding, report)
+        return report
+    except (json.JSONDecodeError, Exception) as e:
+        print(f"Error processing AI response for report: {e}\nResponse was:\n{response.text}")
+        raise Exception("The AI model returned an invalid format for the report.")
+
+# --- Web Page Routes ---
+@app.route('/')
+def serve_landing_page():
+    """Serves the main landing page (assuming you have an index.html)."""
+    return send_from_directory('.', 'index.html')
+
+@app.route('/interview.html')
+def serve_interview_page():
+    """Serves the interactive interview application page."""
+    return send_from_directory('.', 'interview.html')
+
+# --- Static File Serving (WhiteNoise) ---
+# Serve the pages and assets straight from the WSGI layer with precomputed
+# ETag/Last-Modified headers, bypassing Flask view dispatch so workers stay
+# free for Gemini calls. Files are registered individually rather than with
+# root='.' so source files (server.py, .env) are never exposed. If WhiteNoise
+# is missing, the Flask routes above still serve everything.
+_STATIC_FILES = (
+    'index.html',
+    'interview.html',
+    'placementresources.html',
+    'resumechecker.html',
+    'style.css',
+    'script.js',
+    'questions.json',
+    'Untitled27_20250914202354.png',
+)
+try:
+    from whitenoise import WhiteNoise
+    app.wsgi_app = WhiteNoise(app.wsgi_app)
+    for _static_file in _STATIC_FILES:
+        if os.path.exists(_static_file):
+            app.wsgi_app.add_file_to_dictionary('/' + _static_file, _static_file, stat_cache=None)
+    app.wsgi_app.add_file_to_dictionary('/', 'index.html', stat_cache=None)
+except ImportError:
+    pass
+
+# --- API Endpoints ---
+@app.errorhandler(413)
+def handle_oversize_upload(error):
+    """Returns the MAX_CONTENT_LENGTH rejection as JSON, like every other
+    API error, instead of Werkzeug's default HTML 413 page."""
+    return _json_response({"error": "File too large. Please upload a PDF under 5 MB."}, 413)
+
+@app.route('/api/analyze', methods=['POST'])
+async def analyze_resume_api():
+    if 'resume' not in request.files: return _json_response({"error": "No resume file part"}, 400)
+    file = request.files['resume']
+    if file.filename == '': return _json_response({"error": "No file selected"}, 400)
+
+    if file and allowed_file(file.filename):
+        try:
+            data = file.read()  # Stays in memory; no temp file on disk
+            cache_key = hashlib.blake2b(data).hexdigest()
+            analysis = _exact_analysis_cache.get(cache_key)
+            if analysis is None:
+                try:
+                    resume_data = await asyncio.wait_for(
+                        asyncio.to_thread(parse_resume, data), timeout=PARSE_TIMEOUT_SECONDS)
+                except asyncio.TimeoutError:
+                    return _json_response({"error": "PDF parsing timed out. Please upload a simpler PDF."}, 400)
+                analysis = await generate_questions_and_rubric(resume_data)
+                if len(_exact_analysis_cache) >= EXACT_CACHE_MAX_ENTRIES:
+                    _exact_analysis_cache.pop(next(iter(_exact_analysis_cache)))
+                _exact_analysis_cache[cache_key] = analysis
+            session_id = uuid.uuid4().hex
+            if len(_session_rubrics) >= SESSION_RUBRICS_MAX_ENTRIES:
+                _session_rubrics.pop(next(iter(_session_rubrics)))
+            _session_rubrics[session_id] = analysis.get("rubric")
+            return _json_response({"questions": analysis["questions"], "session_id": session_id})
+        except Exception as e:
+            return _json_response({"error": str(e)}, 500)
+    return _json_response({"error": "Invalid file type. Please upload a PDF."}, 400)
+
+@app.route('/api/follow-up', methods=['POST'])
+def follow_up_api():
+    data = request.get_json()
+    if not data or 'history' not in data: return _json_response({"error": "Missing history"}, 400)
+    try:
+        chunks = generate_follow_up_question(data['history'], data.get('session_id'))
+        return Response(stream_with_context(chunks), mimetype='text/plain')
+    except Exception as e:
+        return _json_response({"error": str(e)}, 500)
+
+@app.route('/api/evaluate', methods=['POST'])
+async def evaluate_answers_api():
+    data = request.get_json()
+    if not data or 'answers' not in data: return _json_response({"error": "Missing answers"}, 400)
+    try:
+        rubric = _session_rubrics.get(data.get('session_id'))
+        report = await generate_report(data['answers'], rubric=rubric)
+        return _json_response(report)
+    except Exception as e:
+        return _json_response({"error": str(e)}, 500)
+
+# --- Server Execution ---
+# Initialize at import time: without preloading, gunicorn workers import this
+# module after forking, so each worker builds and pre-warms its own channel
+# before its first request. Do NOT run this app with --preload: a gRPC channel
+# that has carried an RPC does not survive fork(), and workers inheriting one
+# hang on their first Gemini call.
+initialize_gemini()
+
+if __name__ == '__main__':
+    if not model:
+        exit(1) # Exit if the AI model fails to initialize
+
+    # For local development:
+    app.run(host='0.0.0.0', port=5000, debug=True)
+    # For deploying on a platform like Render, your Start Command should be:
+    #   gunicorn -c gunicorn.conf.py "server:app"
+    # Default sync workers handle one request each and would block for the
+    # full Gemini call; the config uses threaded workers so a handful of
+    # processes can multiplex dozens of in-flight LLM requests.
\ No newline at end of file